@@ -1,64 +1,79 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import json
 import sys
 import time
-from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Union
 
-# 插件信息
-PLUGIN_INFO = {
-    "id": "hello_plugin_python",
-    "name": "Hello Plugin (Python)",
-    "version": "1.0.0",
-    "type": "utility",
-    "author": "StellarServer Team",
-    "description": "A simple example plugin written in Python",
-    "category": "example",
-    "tags": ["example", "hello", "utility", "python"],
-    "created_at": datetime.now().isoformat(),
-    "updated_at": datetime.now().isoformat(),
-    "params": [
-        {
-            "name": "name",
-            "type": "string",
-            "description": "Your name",
-            "required": True,
-            "default": "World"
-        },
-        {
-            "name": "greeting",
-            "type": "string",
-            "description": "Greeting message",
-            "required": False,
-            "default": "Hello",
-            "options": ["Hello", "Hi", "Hey", "Greetings"]
-        }
-    ],
-    "language": "Python"
-}
+# JSON编解码：优先使用orjson（C扩展，速度更快），未安装时回退到标准库json
+# dumps统一返回UTF-8字节，直接写入stdout.buffer，不受终端/区域设置编码影响
+try:
+    import orjson
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def loads(data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+except ImportError:
+    import json
+
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("ascii")
+
+    def loads(data: Union[str, bytes]) -> Any:
+        return json.loads(data)
 
 # 全局配置
-CONFIG = {}
+CONFIG: Dict[str, Any] = {}
 
-def info():
-    """返回插件信息"""
-    return PLUGIN_INFO
+@lru_cache(maxsize=1)
+def info() -> Dict[str, Any]:
+    """返回插件信息（首次调用时构建）"""
+    return {
+        "id": "hello_plugin_python",
+        "name": "Hello Plugin (Python)",
+        "version": "1.0.0",
+        "type": "utility",
+        "author": "StellarServer Team",
+        "description": "A simple example plugin written in Python",
+        "category": "example",
+        "tags": ["example", "hello", "utility", "python"],
+        "params": [
+            {
+                "name": "name",
+                "type": "string",
+                "description": "Your name",
+                "required": True,
+                "default": "World"
+            },
+            {
+                "name": "greeting",
+                "type": "string",
+                "description": "Greeting message",
+                "required": False,
+                "default": "Hello",
+                "options": ["Hello", "Hi", "Hey", "Greetings"]
+            }
+        ],
+        "language": "Python"
+    }
 
-def init(config_json):
-    """初始化插件"""
+def init(config_json: Union[str, bytes]) -> Dict[str, Any]:
+    """初始化插件，config_json可以是str或bytes"""
     global CONFIG
-    CONFIG = json.loads(config_json)
+    CONFIG = loads(config_json)
     return {"success": True}
 
-def execute(params_json):
-    """执行插件"""
+def execute(params_json: Union[str, bytes]) -> Dict[str, Any]:
+    """执行插件，params_json可以是str或bytes"""
     # 解析参数
-    params = json.loads(params_json)
+    params = loads(params_json)
     
     # 获取参数值
-    name = params.get("name", "World")
-    greeting = params.get("greeting", "Hello")
+    name: str = params.get("name", "World")
+    greeting: str = params.get("greeting", "Hello")
     
     # 构建消息
     message = f"{greeting}, {name}!"
@@ -69,28 +84,32 @@ def execute(params_json):
         "data": message,
         "message": "Plugin executed successfully",
         "metadata": {
-            "timestamp": datetime.now().isoformat()
+            "timestamp": time.time()
         }
     }
     
-    return json.dumps(result)
+    return result
 
-def validate(params_json):
-    """验证参数"""
-    params = json.loads(params_json)
+def validate(params_json: Union[str, bytes]) -> Dict[str, Any]:
+    """验证参数，params_json可以是str或bytes"""
+    params = loads(params_json)
     
     # 检查必需参数
     if "name" not in params:
-        return json.dumps({
+        return {
             "success": False,
             "error": "Missing required parameter: name"
-        })
+        }
     
-    return json.dumps({"success": True})
+    return {"success": True}
 
-def cleanup():
+def cleanup() -> Dict[str, Any]:
     """清理资源"""
-    return json.dumps({"success": True})
+    return {"success": True}
+
+def _emit(obj: Any) -> None:
+    """将结果序列化为JSON字节写入标准输出，输入输出均以字节处理"""
+    sys.stdout.buffer.write(dumps(obj) + b"\n")
 
 if __name__ == "__main__":
     # 命令行接口
@@ -101,26 +120,26 @@ if __name__ == "__main__":
     command = sys.argv[1]
     
     if command == "info":
-        print(json.dumps(info()))
+        _emit(info())
     
     elif command == "init":
-        config_json = sys.stdin.read()
-        print(json.dumps(init(config_json)))
+        config_json = sys.stdin.buffer.read()
+        _emit(init(config_json))
     
     elif command == "execute":
-        params_json = sys.stdin.read()
-        print(execute(params_json))
+        params_json = sys.stdin.buffer.read()
+        _emit(execute(params_json))
     
     elif command == "validate":
-        params_json = sys.stdin.read()
-        print(validate(params_json))
+        params_json = sys.stdin.buffer.read()
+        _emit(validate(params_json))
     
     elif command == "cleanup":
-        print(cleanup())
+        _emit(cleanup())
     
     else:
-        print(json.dumps({
+        _emit({
             "success": False,
             "error": f"Unknown command: {command}"
-        }))
+        })
         sys.exit(1) 
\ No newline at end of file
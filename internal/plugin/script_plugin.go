@@ -1,12 +1,12 @@
 package plugin
 
 import (
+	"bytes"
 	"encoding/json"
 	"fmt"
 	"os"
 	"os/exec"
 	"path/filepath"
-	"strings"
 	"time"
 )
 
@@ -68,7 +68,7 @@ func (p *ScriptPlugin) Init(config map[string]interface{}) error {
 
 	// 调用脚本的init命令初始化插件
 	cmd := exec.Command(p.interpreter, p.path, "init")
-	cmd.Stdin = strings.NewReader(string(configJSON))
+	cmd.Stdin = bytes.NewReader(configJSON)
 	if err := cmd.Run(); err != nil {
 		return fmt.Errorf("初始化插件失败: %v", err)
 	}
@@ -105,7 +105,7 @@ func (p *ScriptPlugin) Execute(ctx PluginContext) (PluginResult, error) {
 
 	// 准备命令
 	cmd := exec.CommandContext(ctx.Context, p.interpreter, p.path, "execute")
-	cmd.Stdin = strings.NewReader(string(paramsJSON))
+	cmd.Stdin = bytes.NewReader(paramsJSON)
 	cmd.Env = append(os.Environ(),
 		fmt.Sprintf("PLUGIN_ENV_FILE=%s", envFile.Name()),
 		fmt.Sprintf("PLUGIN_WORK_DIR=%s", ctx.WorkDir),
@@ -166,7 +166,7 @@ func (p *ScriptPlugin) Validate(params map[string]interface{}) error {
 
 	// 调用脚本的validate命令验证参数
 	cmd := exec.Command(p.interpreter, p.path, "validate")
-	cmd.Stdin = strings.NewReader(string(paramsJSON))
+	cmd.Stdin = bytes.NewReader(paramsJSON)
 	if err := cmd.Run(); err != nil {
 		return fmt.Errorf("验证参数失败: %v", err)
 	}
@@ -4,6 +4,7 @@ import (
 	"context"
 	"fmt"
 	"io"
+	"io/fs"
 	"log"
 	"net/http"
 	"os"
@@ -155,12 +156,14 @@ type DetectionSummary struct {
 // Detector 敏感信息检测器
 type Detector struct {
 	// TODO: 添加具体的字段实现
-	db        *mongo.Database
-	ruleMap   map[string]*models.SensitiveRule
-	mu        sync.RWMutex
-	logger    SimpleLogger // TODO: 替换为实际的logger类型（已完善接口）
-	rules     []*models.SensitiveRule // TODO: 完善规则管理
-	whitelist []*models.SensitiveWhitelist    // TODO: 完善白名单管理（修复为正确的类型）
+	db         *mongo.Database
+	ruleMap    map[string]*models.SensitiveRule
+	mu         sync.RWMutex
+	logger     SimpleLogger                 // TODO: 替换为实际的logger类型（已完善接口）
+	rules      []*models.SensitiveRule      // TODO: 完善规则管理
+	whitelist  []*models.SensitiveWhitelist // TODO: 完善白名单管理（修复为正确的类型）
+	regexCache map[string]compiledPattern   // 已编译的正则表达式缓存，创建检测器时编译，之后只读
+	client     *http.Client                 // 共享的HTTP客户端，复用连接
 }
 
 // NewSimpleLogger 创建简单日志器
@@ -178,15 +181,74 @@ func (l *simpleLogger) Info(msg string, args ...interface{}) {
 	log.Printf("INFO: "+msg, args...)
 }
 
+// compiledPattern 正则表达式编译结果，编译失败的模式同样缓存，避免每次匹配重复编译和记录日志
+type compiledPattern struct {
+	regex *regexp.Regexp
+	err   error
+}
+
 // NewDetector 创建检测器
 func NewDetector(db *mongo.Database, rules []*DetectionRule) *Detector {
-	return &Detector{
+	d := &Detector{
 		db:        db,
 		rules:     convertDetectionRules(rules),
 		ruleMap:   make(map[string]*models.SensitiveRule),
 		whitelist: []*models.SensitiveWhitelist{},
 		logger:    NewSimpleLogger(),
+		client:    newDetectorHTTPClient(),
+	}
+	d.regexCache = d.compileRegexCache()
+	return d
+}
+
+// newDetectorHTTPClient 创建检测器共享的HTTP客户端
+// 默认Transport每个主机只保留2个空闲连接，并发检测同一站点时会反复建立TCP/TLS连接
+func newDetectorHTTPClient() *http.Client {
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.MaxIdleConns = 100
+	transport.MaxIdleConnsPerHost = 20
+
+	return &http.Client{Transport: transport}
+}
+
+// compileRegexCache 编译规则、误报模式和白名单中的全部正则表达式
+// 无效模式连同错误一起缓存，只在加载时记录一次日志
+func (d *Detector) compileRegexCache() map[string]compiledPattern {
+	cache := make(map[string]compiledPattern)
+	load := func(pattern, kind string) {
+		if _, ok := cache[pattern]; ok {
+			return
+		}
+		regex, err := regexp.Compile(pattern)
+		if err != nil {
+			d.logger.Error(kind+"正则表达式无效", err, "pattern", pattern)
+		}
+		cache[pattern] = compiledPattern{regex: regex, err: err}
+	}
+
+	for _, rule := range d.rules {
+		load(rule.Pattern, "规则")
+		for _, pattern := range rule.FalsePositivePatterns {
+			load(pattern, "误报模式")
+		}
 	}
+	for _, item := range d.whitelist {
+		if item.Type == "pattern" {
+			load(item.Value, "白名单")
+		}
+	}
+
+	return cache
+}
+
+// compilePattern 获取已编译的正则表达式，编译失败时返回缓存的错误
+// Go的regexp基于RE2实现，匹配为线性时间；缓存避免了每个目标、每条规则重复编译
+func (d *Detector) compilePattern(pattern string) (*regexp.Regexp, error) {
+	compiled, ok := d.regexCache[pattern]
+	if !ok {
+		return nil, fmt.Errorf("正则表达式未加载: %s", pattern)
+	}
+	return compiled.regex, compiled.err
 }
 
 // convertDetectionRules 转换规则类型
@@ -540,25 +602,37 @@ func (d *Detector) detectURLTarget(ctx context.Context, target string, config mo
 	}
 
 	// 应用规则检测
-	return d.applyRules(ctx, target, content, config)
+	return d.applyRules(ctx, target, content, 0, config)
 }
 
 // detectSingleFile 检测单个文件
 func (d *Detector) detectSingleFile(ctx context.Context, target string, config models.SensitiveDetectionConfig) ([]*models.SensitiveFinding, error) {
 	// 获取文件内容
-	content, err := d.fetchFileContent(ctx, target, config)
+	content, fileSize, err := d.fetchFileContent(ctx, target, config)
 	if err != nil {
 		return nil, err
 	}
 
 	// 应用规则检测
-	return d.applyRules(ctx, target, content, config)
+	return d.applyRules(ctx, target, content, fileSize, config)
 }
 
-// applyRules 应用规则检测内容
-func (d *Detector) applyRules(ctx context.Context, target string, content string, config models.SensitiveDetectionConfig) ([]*models.SensitiveFinding, error) {
+// applyRules 应用规则检测内容，fileSize为读取文件时获取的大小（URL目标为0）
+func (d *Detector) applyRules(ctx context.Context, target string, content string, fileSize int64, config models.SensitiveDetectionConfig) ([]*models.SensitiveFinding, error) {
 	var findings []*models.SensitiveFinding
 
+	// 以下信息对同一目标的所有匹配都相同，只计算一次
+	detectedAt := time.Now()
+
+	// 按行分割的内容，在第一个有效匹配时才分割，无匹配的目标不付出分割开销
+	var lines []string
+
+	// 确定目标类型
+	targetType := "url"
+	if !strings.HasPrefix(target, "http") {
+		targetType = "file"
+	}
+
 	// 应用每个规则
 	for _, rule := range d.rules {
 		// 跳过禁用的规则
@@ -566,28 +640,20 @@ func (d *Detector) applyRules(ctx context.Context, target string, content string
 			continue
 		}
 
-		// 编译正则表达式
-		regex, err := regexp.Compile(rule.Pattern)
+		// 获取编译后的正则表达式（无效模式已在加载时记录）
+		regex, err := d.compilePattern(rule.Pattern)
 		if err != nil {
-			d.logger.Error("规则正则表达式无效", err, "rule", rule.Name, "pattern", rule.Pattern)
 			continue
 		}
 
-		// 查找匹配
-		matches := regex.FindAllStringSubmatch(content, -1)
+		// 查找匹配（只使用完整匹配文本，不需要子匹配）
+		matches := regex.FindAllString(content, -1)
 		if len(matches) == 0 {
 			continue
 		}
 
 		// 处理每个匹配
-		for _, match := range matches {
-			if len(match) == 0 {
-				continue
-			}
-
-			// 提取匹配内容
-			matchedText := match[0]
-
+		for _, matchedText := range matches {
 			// 检查白名单
 			if d.isWhitelisted(target, matchedText) {
 				continue
@@ -599,21 +665,10 @@ func (d *Detector) applyRules(ctx context.Context, target string, content string
 			}
 
 			// 提取上下文和行号
-			context, lineNumber := d.extractContextWithLineNumber(content, matchedText, config.ContextLines)
-
-			// 确定目标类型
-			targetType := "url"
-			if !strings.HasPrefix(target, "http") {
-				targetType = "file"
-			}
-
-			// 获取文件信息
-			var fileSize int64
-			if targetType == "file" {
-				if info, err := os.Stat(target); err == nil {
-					fileSize = info.Size()
-				}
+			if lines == nil {
+				lines = strings.Split(content, "\n")
 			}
+			context, lineNumber := d.extractContextWithLineNumber(content, lines, matchedText, config.ContextLines)
 
 			// 创建发现
 			finding := &models.SensitiveFinding{
@@ -630,7 +685,7 @@ func (d *Detector) applyRules(ctx context.Context, target string, content string
 				LineNumber:  lineNumber,
 				FilePath:    target, // 对于文件，存储完整路径
 				FileSize:    fileSize,
-				CreatedAt:   time.Now(),
+				CreatedAt:   detectedAt,
 			}
 
 			findings = append(findings, finding)
@@ -662,7 +717,8 @@ func (d *Detector) fetchContent(ctx context.Context, target string, config model
 		return d.fetchWebContent(ctx, target, config)
 	} else if strings.HasPrefix(target, "file://") || !strings.Contains(target, "://") {
 		// 处理文件内容
-		return d.fetchFileContent(ctx, target, config)
+		content, _, err := d.fetchFileContent(ctx, target, config)
+		return content, err
 	} else {
 		return "", fmt.Errorf("不支持的目标类型: %s", target)
 	}
@@ -670,6 +726,13 @@ func (d *Detector) fetchContent(ctx context.Context, target string, config model
 
 // fetchWebContent 获取网页内容
 func (d *Detector) fetchWebContent(ctx context.Context, url string, config models.SensitiveDetectionConfig) (string, error) {
+	// 设置超时（覆盖请求和读取响应体）
+	if config.Timeout > 0 {
+		var cancel context.CancelFunc
+		ctx, cancel = context.WithTimeout(ctx, time.Duration(config.Timeout)*time.Second)
+		defer cancel()
+	}
+
 	// 创建HTTP请求
 	req, err := http.NewRequestWithContext(ctx, "GET", url, nil)
 	if err != nil {
@@ -679,13 +742,8 @@ func (d *Detector) fetchWebContent(ctx context.Context, url string, config model
 	// 设置User-Agent
 	req.Header.Set("User-Agent", "StellarServer/1.0")
 
-	// 设置超时
-	client := &http.Client{
-		Timeout: time.Duration(config.Timeout) * time.Second,
-	}
-
 	// 发送请求
-	resp, err := client.Do(req)
+	resp, err := d.client.Do(req)
 	if err != nil {
 		return "", err
 	}
@@ -693,6 +751,8 @@ func (d *Detector) fetchWebContent(ctx context.Context, url string, config model
 
 	// 检查状态码
 	if resp.StatusCode != http.StatusOK {
+		// 读完剩余响应体，使连接可以放回连接池复用
+		_, _ = io.Copy(io.Discard, io.LimitReader(resp.Body, 64*1024))
 		return "", fmt.Errorf("HTTP请求失败，状态码: %d", resp.StatusCode)
 	}
 
@@ -714,9 +774,8 @@ func (d *Detector) isWhitelisted(target string, text string) bool {
 				return true
 			}
 		case "pattern":
-			regex, err := regexp.Compile(item.Value)
+			regex, err := d.compilePattern(item.Value)
 			if err != nil {
-				d.logger.Error("白名单正则表达式无效", err, "value", item.Value)
 				continue
 			}
 			if regex.MatchString(text) {
@@ -730,9 +789,8 @@ func (d *Detector) isWhitelisted(target string, text string) bool {
 // isFalsePositive 检查是否为误报
 func (d *Detector) isFalsePositive(rule *models.SensitiveRule, text string) bool {
 	for _, pattern := range rule.FalsePositivePatterns {
-		regex, err := regexp.Compile(pattern)
+		regex, err := d.compilePattern(pattern)
 		if err != nil {
-			d.logger.Error("误报模式正则表达式无效", err, "pattern", pattern)
 			continue
 		}
 		if regex.MatchString(text) {
@@ -801,11 +859,8 @@ func (d *Detector) extractContext(content, matchedText string, contextLines int)
 	return context
 }
 
-// extractContextWithLineNumber 提取上下文和行号
-func (d *Detector) extractContextWithLineNumber(content, matchedText string, contextLines int) (string, int) {
-	// 分割内容为行
-	lines := strings.Split(content, "\n")
-	
+// extractContextWithLineNumber 提取上下文和行号，lines为content按行分割的结果
+func (d *Detector) extractContextWithLineNumber(content string, lines []string, matchedText string, contextLines int) (string, int) {
 	// 查找匹配文本所在的行
 	var matchLine = -1
 	for i, line := range lines {
@@ -840,8 +895,8 @@ func (d *Detector) extractContextWithLineNumber(content, matchedText string, con
 	return context, matchLine + 1
 }
 
-// fetchFileContent 获取文件内容
-func (d *Detector) fetchFileContent(ctx context.Context, target string, config models.SensitiveDetectionConfig) (string, error) {
+// fetchFileContent 获取文件内容，同时返回文件大小
+func (d *Detector) fetchFileContent(ctx context.Context, target string, config models.SensitiveDetectionConfig) (string, int64, error) {
 	// 移除 file:// 前缀（如果存在）
 	filePath := target
 	if strings.HasPrefix(target, "file://") {
@@ -850,75 +905,79 @@ func (d *Detector) fetchFileContent(ctx context.Context, target string, config m
 
 	// 检查文件扩展名，决定是否需要处理
 	if !d.isTextFile(filePath) {
-		return "", fmt.Errorf("不支持的文件类型: %s", filePath)
+		return "", 0, fmt.Errorf("不支持的文件类型: %s", filePath)
 	}
 
 	// 检查文件大小，避免处理过大的文件
 	info, err := os.Stat(filePath)
 	if err != nil {
-		return "", fmt.Errorf("无法获取文件信息: %v", err)
+		return "", 0, fmt.Errorf("无法获取文件信息: %v", err)
 	}
 
 	// 限制文件大小为10MB
 	maxFileSize := int64(10 * 1024 * 1024) // 10MB
 	if info.Size() > maxFileSize {
-		return "", fmt.Errorf("文件过大，超过限制 (%d bytes)", maxFileSize)
+		return "", 0, fmt.Errorf("文件过大，超过限制 (%d bytes)", maxFileSize)
 	}
 
 	// 读取文件内容
 	content, err := os.ReadFile(filePath)
 	if err != nil {
-		return "", fmt.Errorf("读取文件失败: %v", err)
+		return "", 0, fmt.Errorf("读取文件失败: %v", err)
 	}
 
 	// 尝试检测文件编码并转换为UTF-8
-	return d.convertToUTF8(content)
+	text, err := d.convertToUTF8(content)
+	if err != nil {
+		return "", 0, err
+	}
+	return text, info.Size(), nil
+}
+
+// textExtensions 检测器支持的文本文件扩展名
+var textExtensions = map[string]bool{
+	".txt":        true,
+	".log":        true,
+	".json":       true,
+	".xml":        true,
+	".html":       true,
+	".htm":        true,
+	".css":        true,
+	".js":         true,
+	".ts":         true,
+	".java":       true,
+	".py":         true,
+	".go":         true,
+	".c":          true,
+	".cpp":        true,
+	".h":          true,
+	".hpp":        true,
+	".php":        true,
+	".rb":         true,
+	".sh":         true,
+	".bat":        true,
+	".ps1":        true,
+	".yml":        true,
+	".yaml":       true,
+	".ini":        true,
+	".conf":       true,
+	".config":     true,
+	".properties": true,
+	".env":        true,
+	".sql":        true,
+	".md":         true,
+	".markdown":   true,
+	".rst":        true,
+	".csv":        true,
+	".tsv":        true,
+	".dockerfile": true,
+	".gitignore":  true,
+	".gitattributes": true,
+	"":            true, // 无扩展名的文件也尝试处理
 }
 
 // isTextFile 检查是否为文本文件
 func (d *Detector) isTextFile(filePath string) bool {
-	// 支持的文本文件扩展名
-	textExtensions := map[string]bool{
-		".txt":        true,
-		".log":        true,
-		".json":       true,
-		".xml":        true,
-		".html":       true,
-		".htm":        true,
-		".css":        true,
-		".js":         true,
-		".ts":         true,
-		".java":       true,
-		".py":         true,
-		".go":         true,
-		".c":          true,
-		".cpp":        true,
-		".h":          true,
-		".hpp":        true,
-		".php":        true,
-		".rb":         true,
-		".sh":         true,
-		".bat":        true,
-		".ps1":        true,
-		".yml":        true,
-		".yaml":       true,
-		".ini":        true,
-		".conf":       true,
-		".config":     true,
-		".properties": true,
-		".env":        true,
-		".sql":        true,
-		".md":         true,
-		".markdown":   true,
-		".rst":        true,
-		".csv":        true,
-		".tsv":        true,
-		".dockerfile": true,
-		".gitignore":  true,
-		".gitattributes": true,
-		"":            true, // 无扩展名的文件也尝试处理
-	}
-
 	// 获取文件扩展名
 	ext := strings.ToLower(filepath.Ext(filePath))
 	return textExtensions[ext]
@@ -986,7 +1045,8 @@ func (d *Detector) detectDirectory(ctx context.Context, dirPath string, config m
 	var findings []*models.SensitiveFinding
 
 	// 遍历目录
-	err := filepath.Walk(dirPath, func(path string, info os.FileInfo, err error) error {
+	// 使用WalkDir直接读取目录项类型，不再对每个条目单独调用stat
+	err := filepath.WalkDir(dirPath, func(path string, entry fs.DirEntry, err error) error {
 		if err != nil {
 			return err
 		}
@@ -999,7 +1059,7 @@ func (d *Detector) detectDirectory(ctx context.Context, dirPath string, config m
 		}
 
 		// 跳过目录
-		if info.IsDir() {
+		if entry.IsDir() {
 			// 如果不是递归模式，跳过子目录
 			if !recursive && path != dirPath {
 				return filepath.SkipDir
@@ -1007,13 +1067,22 @@ func (d *Detector) detectDirectory(ctx context.Context, dirPath string, config m
 			return nil
 		}
 
+		// 符号链接：WalkDir不跟随链接，需要自行判断链接目标
+		// 指向普通文件的链接照常检测；指向目录的链接跳过，避免循环链接导致无限递归
+		if entry.Type()&fs.ModeSymlink != 0 {
+			info, err := os.Stat(path)
+			if err != nil || !info.Mode().IsRegular() {
+				return nil
+			}
+		}
+
 		// 检查文件是否为文本文件
 		if !d.isTextFile(path) {
 			return nil
 		}
 
-		// 检测文件
-		fileFindings, err := d.detectTarget(ctx, path, config)
+		// 检测文件（遍历时已知为文件，无需再判断目标类型）
+		fileFindings, err := d.detectSingleFile(ctx, path, config)
 		if err != nil {
 			d.logger.Error("检测文件失败", err, "file", path)
 			return nil // 继续处理其他文件
@@ -5,6 +5,7 @@ import (
 	"encoding/json"
 	"fmt"
 	"io"
+	"io/fs"
 	"net/http"
 	"os"
 	"path/filepath"
@@ -84,9 +85,11 @@ func (e *DetectionEngine) fetchContent(url string) (string, http.Header, int, er
 	return string(contentBytes), resp.Header, resp.StatusCode, nil
 }
 
+// titleRegex 页面标题正则，包加载时编译一次
+var titleRegex = regexp.MustCompile(`<title[^>]*>([^<]+)</title>`)
+
 // extractTitle 提取标题
 func (e *DetectionEngine) extractTitle(content string) string {
-	titleRegex := regexp.MustCompile(`<title[^>]*>([^<]+)</title>`)
 	matches := titleRegex.FindStringSubmatch(content)
 	if len(matches) > 1 {
 		return strings.TrimSpace(matches[1])
@@ -664,13 +667,13 @@ func (e *DetectionEngine) ScanFile(filePath string) (*DetectionResult, error) {
 func (e *DetectionEngine) ScanDirectory(dirPath string, recursive bool) ([]*DetectionResult, error) {
 	var results []*DetectionResult
 
-	err := filepath.Walk(dirPath, func(path string, info os.FileInfo, err error) error {
+	err := filepath.WalkDir(dirPath, func(path string, entry fs.DirEntry, err error) error {
 		if err != nil {
 			return err
 		}
 
 		// 跳过目录
-		if info.IsDir() {
+		if entry.IsDir() {
 			if !recursive && path != dirPath {
 				return filepath.SkipDir
 			}
@@ -699,20 +702,21 @@ func (e *DetectionEngine) ScanDirectory(dirPath string, recursive bool) ([]*Dete
 	return results, err
 }
 
+// engineTextExtensions 检测引擎扫描目录时处理的文本文件扩展名
+var engineTextExtensions = map[string]bool{
+	".txt": true, ".log": true, ".json": true, ".xml": true,
+	".html": true, ".htm": true, ".css": true, ".js": true,
+	".ts": true, ".java": true, ".py": true, ".go": true,
+	".c": true, ".cpp": true, ".h": true, ".hpp": true,
+	".php": true, ".rb": true, ".sh": true, ".bat": true,
+	".yml": true, ".yaml": true, ".ini": true, ".conf": true,
+	".env": true, ".sql": true, ".md": true, ".csv": true,
+}
+
 // isTextFile 检查是否为文本文件
 func (e *DetectionEngine) isTextFile(filePath string) bool {
-	textExtensions := map[string]bool{
-		".txt": true, ".log": true, ".json": true, ".xml": true,
-		".html": true, ".htm": true, ".css": true, ".js": true,
-		".ts": true, ".java": true, ".py": true, ".go": true,
-		".c": true, ".cpp": true, ".h": true, ".hpp": true,
-		".php": true, ".rb": true, ".sh": true, ".bat": true,
-		".yml": true, ".yaml": true, ".ini": true, ".conf": true,
-		".env": true, ".sql": true, ".md": true, ".csv": true,
-	}
-
 	ext := strings.ToLower(filepath.Ext(filePath))
-	return textExtensions[ext]
+	return engineTextExtensions[ext]
 }
 
 // GetResults 获取检测结果
@@ -8,8 +8,10 @@ import (
 	"fmt"
 	"html/template"
 	"sort"
+	"strconv"
 	"strings"
 	"time"
+	"unicode/utf8"
 
 	"github.com/StellarServer/internal/models"
 )
@@ -35,8 +37,14 @@ type XMLMetadata struct {
 
 // XMLSummary XML摘要结构
 type XMLSummary struct {
-	RiskStatistics     map[string]int `xml:"RiskStatistics"`
-	CategoryStatistics map[string]int `xml:"CategoryStatistics"`
+	RiskStatistics     []XMLStatItem `xml:"RiskStatistics>Item"`
+	CategoryStatistics []XMLStatItem `xml:"CategoryStatistics>Item"`
+}
+
+// XMLStatItem XML统计项
+type XMLStatItem struct {
+	Name  string `xml:"name,attr"`
+	Count int    `xml:",chardata"`
 }
 
 // XMLFinding XML发现结构
@@ -52,6 +60,37 @@ type XMLFinding struct {
 	CreatedAt    string `xml:"CreatedAt"`
 }
 
+// 报告缓冲区预分配的估算大小（字节），避免大量发现时缓冲区反复扩容拷贝
+const (
+	htmlReportRowSize    = 512
+	csvReportRowSize     = 384
+	txtReportHeaderSize  = 1024
+	txtReportFindingSize = 768
+)
+
+// 报告单元格的截断长度（字节）
+const (
+	csvMatchedTextMaxLen = 100
+	csvContextMaxLen     = 150
+	txtMatchedTextMaxLen = 200
+	txtContextMaxLen     = 300
+)
+
+// truncateEllipsis 截断后追加的省略号
+const truncateEllipsis = "..."
+
+// reportTimeLayout 报告中的时间格式
+const reportTimeLayout = "2006-01-02 15:04:05"
+
+// txtFindingFormat 文本报告中单条发现固定字段的格式，整条记录一次格式化写入
+const txtFindingFormat = "发现 #%d:\n" +
+	"  目标: %s\n" +
+	"  类型: %s\n" +
+	"  规则: %s\n" +
+	"  风险等级: %s\n" +
+	"  分类: %s\n" +
+	"  匹配文本: %s\n"
+
 // ReportGenerator 报告生成器
 type ReportGenerator struct {
 	detector *Detector
@@ -168,46 +207,76 @@ func (rg *ReportGenerator) sortFindings(findings []*models.SensitiveFinding, req
 	if req.SortOrder == "" {
 		req.SortOrder = "desc"
 	}
+	desc := req.SortOrder == "desc"
+
+	switch req.SortBy {
+	case "category", "target":
+		sort.Slice(findings, func(i, j int) bool {
+			var compare int
+			if req.SortBy == "category" {
+				compare = strings.Compare(findings[i].Category, findings[j].Category)
+			} else {
+				compare = strings.Compare(findings[i].Target, findings[j].Target)
+			}
 
-	sort.Slice(findings, func(i, j int) bool {
-		var compare int
-		switch req.SortBy {
-		case "riskLevel":
-			compare = compareRiskLevel(findings[i].RiskLevel, findings[j].RiskLevel)
-		case "category":
-			compare = strings.Compare(findings[i].Category, findings[j].Category)
-		case "target":
-			compare = strings.Compare(findings[i].Target, findings[j].Target)
-		case "time":
-			compare = int(findings[i].CreatedAt.Unix() - findings[j].CreatedAt.Unix())
-		default:
-			compare = compareRiskLevel(findings[i].RiskLevel, findings[j].RiskLevel)
-		}
-
-		if req.SortOrder == "desc" {
-			return compare > 0
+			if desc {
+				return compare > 0
+			}
+			return compare < 0
+		})
+	default:
+		// 风险等级和时间排序：先把排序键计算成一列，比较时只比较整数
+		keys := make([]int64, len(findings))
+		for i, finding := range findings {
+			if req.SortBy == "time" {
+				keys[i] = finding.CreatedAt.Unix()
+			} else {
+				keys[i] = int64(riskLevelWeights[finding.RiskLevel])
+			}
 		}
-		return compare < 0
-	})
+		sort.Sort(&findingSorter{findings: findings, keys: keys, desc: desc})
+	}
 
 	return findings
 }
 
-// compareRiskLevel 比较风险等级
-func compareRiskLevel(level1, level2 string) int {
-	levels := map[string]int{
-		"critical": 4,
-		"high":     3,
-		"medium":   2,
-		"low":      1,
-		"info":     0,
+// riskLevelWeights 风险等级权重
+var riskLevelWeights = map[string]int{
+	"critical": 4,
+	"high":     3,
+	"medium":   2,
+	"low":      1,
+	"info":     0,
+}
+
+// findingSorter 按预先计算的排序键排序发现结果，keys与findings按下标一一对应
+type findingSorter struct {
+	findings []*models.SensitiveFinding
+	keys     []int64
+	desc     bool
+}
+
+func (s *findingSorter) Len() int {
+	return len(s.findings)
+}
+
+func (s *findingSorter) Less(i, j int) bool {
+	if s.desc {
+		return s.keys[i] > s.keys[j]
 	}
+	return s.keys[i] < s.keys[j]
+}
 
-	return levels[level1] - levels[level2]
+func (s *findingSorter) Swap(i, j int) {
+	s.findings[i], s.findings[j] = s.findings[j], s.findings[i]
+	s.keys[i], s.keys[j] = s.keys[j], s.keys[i]
 }
 
 // generateHTMLReport 生成HTML报告
 func (rg *ReportGenerator) generateHTMLReport(result *models.SensitiveDetectionResult, findings []*models.SensitiveFinding, req ReportRequest) (*ReportResult, error) {
+	generatedAt := time.Now()
+	stats := rg.calculateStatistics(findings, false)
+
 	tmpl := rg.getHTMLTemplate(req.Template)
 
 	data := struct {
@@ -221,39 +290,43 @@ func (rg *ReportGenerator) generateHTMLReport(result *models.SensitiveDetectionR
 	}{
 		Result:         result,
 		Findings:       findings,
-		GeneratedAt:    time.Now(),
+		GeneratedAt:    generatedAt,
 		TotalFindings:  len(result.Findings),
 		FilteredCount:  len(findings),
-		RiskStatistics: rg.calculateRiskStatistics(findings),
-		CategoryStats:  rg.calculateCategoryStatistics(findings),
+		RiskStatistics: stats.Risk,
+		CategoryStats:  stats.Category,
 	}
 
 	var buf bytes.Buffer
+	buf.Grow(len(defaultHTMLTemplate) + len(findings)*htmlReportRowSize)
 	if err := tmpl.Execute(&buf, data); err != nil {
 		return nil, fmt.Errorf("生成HTML报告失败: %v", err)
 	}
 
 	filename := fmt.Sprintf("sensitive_report_%s_%s.html", 
 		result.Name, 
-		time.Now().Format("20060102_150405"))
+		generatedAt.Format("20060102_150405"))
 
 	return &ReportResult{
 		Content:     buf.Bytes(),
 		ContentType: "text/html; charset=utf-8",
 		Filename:    filename,
 		Size:        buf.Len(),
-		GeneratedAt: time.Now(),
+		GeneratedAt: generatedAt,
 	}, nil
 }
 
 // generateJSONReport 生成JSON报告
 func (rg *ReportGenerator) generateJSONReport(result *models.SensitiveDetectionResult, findings []*models.SensitiveFinding, req ReportRequest) (*ReportResult, error) {
+	generatedAt := time.Now()
+	stats := rg.calculateStatistics(findings, true)
+
 	report := map[string]interface{}{
 		"metadata": map[string]interface{}{
 			"detectionId":   result.ID.Hex(),
 			"name":          result.Name,
 			"projectId":     result.ProjectID.Hex(),
-			"generatedAt":   time.Now().Format(time.RFC3339),
+			"generatedAt":   generatedAt.Format(time.RFC3339),
 			"totalFindings": len(result.Findings),
 			"filteredCount": len(findings),
 			"status":        result.Status,
@@ -261,9 +334,9 @@ func (rg *ReportGenerator) generateJSONReport(result *models.SensitiveDetectionR
 			"endTime":       result.EndTime.Format(time.RFC3339),
 		},
 		"summary": map[string]interface{}{
-			"riskStatistics":    rg.calculateRiskStatistics(findings),
-			"categoryStatistics": rg.calculateCategoryStatistics(findings),
-			"targetStatistics":  rg.calculateTargetStatistics(findings),
+			"riskStatistics":    stats.Risk,
+			"categoryStatistics": stats.Category,
+			"targetStatistics":  stats.Target,
 		},
 	}
 
@@ -278,67 +351,71 @@ func (rg *ReportGenerator) generateJSONReport(result *models.SensitiveDetectionR
 
 	filename := fmt.Sprintf("sensitive_report_%s_%s.json", 
 		result.Name, 
-		time.Now().Format("20060102_150405"))
+		generatedAt.Format("20060102_150405"))
 
 	return &ReportResult{
 		Content:     content,
 		ContentType: "application/json",
 		Filename:    filename,
 		Size:        len(content),
-		GeneratedAt: time.Now(),
+		GeneratedAt: generatedAt,
 	}, nil
 }
 
 // generateCSVReport 生成CSV报告
 func (rg *ReportGenerator) generateCSVReport(result *models.SensitiveDetectionResult, findings []*models.SensitiveFinding, req ReportRequest) (*ReportResult, error) {
-	var buf bytes.Buffer
-	writer := csv.NewWriter(&buf)
+	generatedAt := time.Now()
 
-	// 写入头部
-	headers := []string{
+	// 先构建全部记录，再一次性写入
+	records := make([][]string, 0, len(findings)+1)
+
+	// 头部
+	records = append(records, []string{
 		"序号", "目标", "目标类型", "规则名称", "风险等级", "分类",
 		"匹配文本", "行号", "上下文", "发现时间", "状态",
-	}
-	writer.Write(headers)
+	})
 
-	// 写入数据
+	// 数据
 	for i, finding := range findings {
-		record := []string{
-			fmt.Sprintf("%d", i+1),
+		records = append(records, []string{
+			strconv.Itoa(i + 1),
 			finding.Target,
 			finding.TargetType,
 			finding.RuleName,
 			finding.RiskLevel,
 			finding.Category,
-			truncateString(finding.MatchedText, 100),
-			fmt.Sprintf("%d", finding.LineNumber),
-			truncateString(finding.Context, 150),
-			finding.CreatedAt.Format("2006-01-02 15:04:05"),
+			truncateString(finding.MatchedText, csvMatchedTextMaxLen),
+			strconv.Itoa(finding.LineNumber),
+			truncateString(finding.Context, csvContextMaxLen),
+			finding.CreatedAt.Format(reportTimeLayout),
 			"", // Status字段暂时为空
-		}
-		writer.Write(record)
+		})
 	}
 
-	writer.Flush()
-	if err := writer.Error(); err != nil {
+	var buf bytes.Buffer
+	buf.Grow(len(records) * csvReportRowSize)
+	if err := csv.NewWriter(&buf).WriteAll(records); err != nil {
 		return nil, fmt.Errorf("生成CSV报告失败: %v", err)
 	}
 
 	filename := fmt.Sprintf("sensitive_report_%s_%s.csv", 
 		result.Name, 
-		time.Now().Format("20060102_150405"))
+		generatedAt.Format("20060102_150405"))
 
 	return &ReportResult{
 		Content:     buf.Bytes(),
 		ContentType: "text/csv",
 		Filename:    filename,
 		Size:        buf.Len(),
-		GeneratedAt: time.Now(),
+		GeneratedAt: generatedAt,
 	}, nil
 }
 
 // generateXMLReport 生成XML报告
 func (rg *ReportGenerator) generateXMLReport(result *models.SensitiveDetectionResult, findings []*models.SensitiveFinding, req ReportRequest) (*ReportResult, error) {
+	generatedAt := time.Now()
+	stats := rg.calculateStatistics(findings, false)
+
 	xmlFindings := make([]XMLFinding, len(findings))
 	for i, finding := range findings {
 		xmlFindings[i] = XMLFinding{
@@ -359,42 +436,46 @@ func (rg *ReportGenerator) generateXMLReport(result *models.SensitiveDetectionRe
 			DetectionID:   result.ID.Hex(),
 			Name:          result.Name,
 			ProjectID:     result.ProjectID.Hex(),
-			GeneratedAt:   time.Now().Format(time.RFC3339),
+			GeneratedAt:   generatedAt.Format(time.RFC3339),
 			TotalFindings: len(result.Findings),
 			FilteredCount: len(findings),
 			Status:        string(result.Status),
 		},
 		Summary: XMLSummary{
-			RiskStatistics:     rg.calculateRiskStatistics(findings),
-			CategoryStatistics: rg.calculateCategoryStatistics(findings),
+			RiskStatistics:     toXMLStatItems(stats.Risk),
+			CategoryStatistics: toXMLStatItems(stats.Category),
 		},
 		Findings: xmlFindings,
 	}
 
-	content, err := xml.MarshalIndent(report, "", "  ")
-	if err != nil {
+	// 添加XML声明后直接编码到同一缓冲区
+	var buf bytes.Buffer
+	buf.WriteString(xml.Header)
+	encoder := xml.NewEncoder(&buf)
+	encoder.Indent("", "  ")
+	if err := encoder.Encode(report); err != nil {
 		return nil, fmt.Errorf("生成XML报告失败: %v", err)
 	}
 
-	// 添加XML声明
-	xmlContent := []byte(xml.Header + string(content))
-
 	filename := fmt.Sprintf("sensitive_report_%s_%s.xml", 
 		result.Name, 
-		time.Now().Format("20060102_150405"))
+		generatedAt.Format("20060102_150405"))
 
 	return &ReportResult{
-		Content:     xmlContent,
+		Content:     buf.Bytes(),
 		ContentType: "application/xml",
 		Filename:    filename,
-		Size:        len(xmlContent),
-		GeneratedAt: time.Now(),
+		Size:        buf.Len(),
+		GeneratedAt: generatedAt,
 	}, nil
 }
 
 // generateTXTReport 生成文本报告
 func (rg *ReportGenerator) generateTXTReport(result *models.SensitiveDetectionResult, findings []*models.SensitiveFinding, req ReportRequest) (*ReportResult, error) {
+	generatedAt := time.Now()
+
 	var buf bytes.Buffer
+	buf.Grow(txtReportHeaderSize)
 
 	// 报告头部
 	buf.WriteString("=================================================================\n")
@@ -403,93 +484,123 @@ func (rg *ReportGenerator) generateTXTReport(result *models.SensitiveDetectionRe
 
 	// 基本信息
 	buf.WriteString("检测信息:\n")
-	buf.WriteString(fmt.Sprintf("  检测名称: %s\n", result.Name))
-	buf.WriteString(fmt.Sprintf("  项目ID: %s\n", result.ProjectID.Hex()))
-	buf.WriteString(fmt.Sprintf("  开始时间: %s\n", result.StartTime.Format("2006-01-02 15:04:05")))
-	buf.WriteString(fmt.Sprintf("  结束时间: %s\n", result.EndTime.Format("2006-01-02 15:04:05")))
-	buf.WriteString(fmt.Sprintf("  检测状态: %s\n", result.Status))
-	buf.WriteString(fmt.Sprintf("  生成时间: %s\n\n", time.Now().Format("2006-01-02 15:04:05")))
+	fmt.Fprintf(&buf, "  检测名称: %s\n", result.Name)
+	fmt.Fprintf(&buf, "  项目ID: %s\n", result.ProjectID.Hex())
+	fmt.Fprintf(&buf, "  开始时间: %s\n", result.StartTime.Format(reportTimeLayout))
+	fmt.Fprintf(&buf, "  结束时间: %s\n", result.EndTime.Format(reportTimeLayout))
+	fmt.Fprintf(&buf, "  检测状态: %s\n", result.Status)
+	fmt.Fprintf(&buf, "  生成时间: %s\n\n", generatedAt.Format(reportTimeLayout))
 
 	// 统计信息
 	buf.WriteString("统计摘要:\n")
-	buf.WriteString(fmt.Sprintf("  总发现数: %d\n", len(result.Findings)))
-	buf.WriteString(fmt.Sprintf("  筛选后: %d\n", len(findings)))
+	fmt.Fprintf(&buf, "  总发现数: %d\n", len(result.Findings))
+	fmt.Fprintf(&buf, "  筛选后: %d\n", len(findings))
 
-	riskStats := rg.calculateRiskStatistics(findings)
+	stats := rg.calculateStatistics(findings, false)
 	buf.WriteString("  风险等级分布:\n")
-	for level, count := range riskStats {
-		buf.WriteString(fmt.Sprintf("    %s: %d\n", level, count))
+	for level, count := range stats.Risk {
+		fmt.Fprintf(&buf, "    %s: %d\n", level, count)
 	}
 
-	categoryStats := rg.calculateCategoryStatistics(findings)
 	buf.WriteString("  分类分布:\n")
-	for category, count := range categoryStats {
-		buf.WriteString(fmt.Sprintf("    %s: %d\n", category, count))
+	for category, count := range stats.Category {
+		fmt.Fprintf(&buf, "    %s: %d\n", category, count)
 	}
 	buf.WriteString("\n")
 
 	// 详细发现
 	if req.IncludeDetails && len(findings) > 0 {
+		buf.Grow(len(findings) * txtReportFindingSize)
 		buf.WriteString("详细发现:\n")
 		buf.WriteString("-----------------------------------------------------------------\n")
 
 		for i, finding := range findings {
-			buf.WriteString(fmt.Sprintf("发现 #%d:\n", i+1))
-			buf.WriteString(fmt.Sprintf("  目标: %s\n", finding.Target))
-			buf.WriteString(fmt.Sprintf("  类型: %s\n", finding.TargetType))
-			buf.WriteString(fmt.Sprintf("  规则: %s\n", finding.RuleName))
-			buf.WriteString(fmt.Sprintf("  风险等级: %s\n", finding.RiskLevel))
-			buf.WriteString(fmt.Sprintf("  分类: %s\n", finding.Category))
-			buf.WriteString(fmt.Sprintf("  匹配文本: %s\n", truncateString(finding.MatchedText, 200)))
+			fmt.Fprintf(&buf, txtFindingFormat,
+				i+1,
+				finding.Target,
+				finding.TargetType,
+				finding.RuleName,
+				finding.RiskLevel,
+				finding.Category,
+				truncateString(finding.MatchedText, txtMatchedTextMaxLen))
 			if finding.LineNumber > 0 {
-				buf.WriteString(fmt.Sprintf("  行号: %d\n", finding.LineNumber))
+				fmt.Fprintf(&buf, "  行号: %d\n", finding.LineNumber)
 			}
 			if finding.Context != "" {
-				buf.WriteString(fmt.Sprintf("  上下文: %s\n", truncateString(finding.Context, 300)))
+				fmt.Fprintf(&buf, "  上下文: %s\n", truncateString(finding.Context, txtContextMaxLen))
 			}
-			buf.WriteString(fmt.Sprintf("  发现时间: %s\n", finding.CreatedAt.Format("2006-01-02 15:04:05")))
+			fmt.Fprintf(&buf, "  发现时间: %s\n", finding.CreatedAt.Format(reportTimeLayout))
 			buf.WriteString("-----------------------------------------------------------------\n")
 		}
 	}
 
 	filename := fmt.Sprintf("sensitive_report_%s_%s.txt", 
 		result.Name, 
-		time.Now().Format("20060102_150405"))
+		generatedAt.Format("20060102_150405"))
 
 	return &ReportResult{
 		Content:     buf.Bytes(),
 		ContentType: "text/plain; charset=utf-8",
 		Filename:    filename,
 		Size:        buf.Len(),
-		GeneratedAt: time.Now(),
+		GeneratedAt: generatedAt,
 	}, nil
 }
 
-// 统计计算函数
-func (rg *ReportGenerator) calculateRiskStatistics(findings []*models.SensitiveFinding) map[string]int {
-	stats := make(map[string]int)
-	for _, finding := range findings {
-		stats[finding.RiskLevel]++
-	}
-	return stats
+// reportStatistics 报告统计结果
+type reportStatistics struct {
+	Risk     map[string]int // 风险等级分布
+	Category map[string]int // 分类分布
+	Target   map[string]int // 目标分布，仅withTargets为true时统计
 }
 
-func (rg *ReportGenerator) calculateCategoryStatistics(findings []*models.SensitiveFinding) map[string]int {
-	stats := make(map[string]int)
+// calculateStatistics 一次遍历同时统计风险等级、分类和目标分布
+func (rg *ReportGenerator) calculateStatistics(findings []*models.SensitiveFinding, withTargets bool) reportStatistics {
+	stats := reportStatistics{
+		Risk:     make(map[string]int),
+		Category: make(map[string]int),
+	}
+	if withTargets {
+		stats.Target = make(map[string]int)
+	}
+
 	for _, finding := range findings {
-		stats[finding.Category]++
+		stats.Risk[finding.RiskLevel]++
+		stats.Category[finding.Category]++
+		if withTargets {
+			stats.Target[finding.Target]++
+		}
 	}
+
 	return stats
 }
 
-func (rg *ReportGenerator) calculateTargetStatistics(findings []*models.SensitiveFinding) map[string]int {
-	stats := make(map[string]int)
-	for _, finding := range findings {
-		stats[finding.Target]++
+// toXMLStatItems 将统计结果转换为按名称排序的XML统计项
+// encoding/xml不支持map类型，名称作为属性值由编码器统一转义
+func toXMLStatItems(stats map[string]int) []XMLStatItem {
+	items := make([]XMLStatItem, 0, len(stats))
+	for name, count := range stats {
+		items = append(items, XMLStatItem{Name: name, Count: count})
 	}
-	return stats
+	sort.Slice(items, func(i, j int) bool {
+		return items[i].Name < items[j].Name
+	})
+	return items
+}
+
+// reportTemplateFuncs HTML报告模板函数
+var reportTemplateFuncs = template.FuncMap{
+	"add": func(a, b int) int {
+		return a + b
+	},
+	"truncate": truncateString,
 }
 
+// defaultReportTemplate 默认HTML报告模板，包加载时解析一次，执行时可并发复用
+var defaultReportTemplate = template.Must(
+	template.New("report").Funcs(reportTemplateFuncs).Parse(defaultHTMLTemplate),
+)
+
 // getHTMLTemplate 获取HTML模板
 func (rg *ReportGenerator) getHTMLTemplate(templateName string) *template.Template {
 	if templateName != "" {
@@ -497,25 +608,22 @@ func (rg *ReportGenerator) getHTMLTemplate(templateName string) *template.Templa
 		// 暂时使用默认模板
 	}
 
-	// 创建模板并注册函数
-	tmpl := template.New("report").Funcs(template.FuncMap{
-		"add": func(a, b int) int {
-			return a + b
-		},
-		"truncate": func(s string, length int) string {
-			return truncateString(s, length)
-		},
-	})
-
-	return template.Must(tmpl.Parse(defaultHTMLTemplate))
+	return defaultReportTemplate
 }
 
 // truncateString 截断字符串
+// 按字节长度截断，但会回退到完整字符边界，避免切断中文等多字节字符产生非法UTF-8
 func truncateString(s string, maxLen int) string {
 	if len(s) <= maxLen {
 		return s
 	}
-	return s[:maxLen] + "..."
+
+	// UTF-8字符最多4字节，最多回退3个字节；非法UTF-8内容也不会一直回退
+	cut := maxLen
+	for cut > 0 && cut > maxLen-utf8.UTFMax+1 && !utf8.RuneStart(s[cut]) {
+		cut--
+	}
+	return s[:cut] + truncateEllipsis
 }
 
 // defaultHTMLTemplate 默认HTML模板
@@ -630,7 +738,7 @@ const defaultHTMLTemplate = `<!DOCTYPE html>
                         <td><span class="risk-badge {{$finding.RiskLevel}}">{{$finding.RiskLevel}}</span></td>
                         <td>{{$finding.Category}}</td>
                         <td><code class="matched-text">{{truncate $finding.MatchedText 50}}</code></td>
-                        <td>{{$finding.FoundAt.Format "01-02 15:04"}}</td>
+                        <td>{{$finding.CreatedAt.Format "01-02 15:04"}}</td>
                     </tr>
                     {{end}}
                 </tbody>
@@ -0,0 +1,88 @@
+package sensitive
+
+import (
+	"encoding/xml"
+	"strings"
+	"testing"
+	"time"
+	"unicode/utf8"
+
+	"github.com/StellarServer/internal/models"
+	"github.com/stretchr/testify/assert"
+	"go.mongodb.org/mongo-driver/bson/primitive"
+)
+
+// newTestReportResult 构造只包含给定发现的检测结果
+func newTestReportResult(findings ...*models.SensitiveFinding) *models.SensitiveDetectionResult {
+	now := time.Now()
+	return &models.SensitiveDetectionResult{
+		ID:        primitive.NewObjectID(),
+		ProjectID: primitive.NewObjectID(),
+		Name:      "测试检测",
+		Status:    models.SensitiveDetectionStatusCompleted,
+		StartTime: now.Add(-time.Minute),
+		EndTime:   now,
+		Findings:  findings,
+	}
+}
+
+func TestGenerateHTMLReport_MultiByteMatchedText(t *testing.T) {
+	// 60字节的中文文本，模板按50字节截断时会落在字符中间
+	matchedText := strings.Repeat("密钥", 10)
+	finding := &models.SensitiveFinding{
+		ID:          primitive.NewObjectID(),
+		Target:      "http://example.com",
+		RuleName:    "测试规则",
+		Category:    "密钥",
+		RiskLevel:   "high",
+		MatchedText: matchedText,
+		CreatedAt:   time.Date(2024, 3, 5, 14, 30, 0, 0, time.Local),
+	}
+	result := newTestReportResult(finding)
+
+	rg := NewReportGenerator(nil)
+	report, err := rg.generateHTMLReport(result, result.Findings, ReportRequest{Format: ReportFormatHTML})
+	assert.NoError(t, err)
+	if !assert.NotNil(t, report) {
+		return
+	}
+
+	assert.True(t, utf8.Valid(report.Content))
+	content := string(report.Content)
+	assert.Contains(t, content, strings.Repeat("密钥", 8)+truncateEllipsis)
+	assert.Contains(t, content, "03-05 14:30")
+}
+
+func TestGenerateXMLReport_EscapesStatisticNames(t *testing.T) {
+	category := `a<&"b`
+	finding := &models.SensitiveFinding{
+		ID:          primitive.NewObjectID(),
+		Target:      "http://example.com",
+		RuleName:    "测试规则",
+		Category:    category,
+		RiskLevel:   "medium",
+		MatchedText: "secret",
+		CreatedAt:   time.Now(),
+	}
+	result := newTestReportResult(finding)
+
+	rg := NewReportGenerator(nil)
+	report, err := rg.generateXMLReport(result, result.Findings, ReportRequest{Format: ReportFormatXML})
+	assert.NoError(t, err)
+	if !assert.NotNil(t, report) {
+		return
+	}
+
+	// 统计项名称作为属性输出时需要转义
+	content := string(report.Content)
+	assert.Contains(t, content, `name="a&lt;&amp;&#34;b"`)
+	assert.NotContains(t, content, category)
+
+	// 解析后应还原出原始分类名称
+	var decoded XMLReport
+	assert.NoError(t, xml.Unmarshal(report.Content, &decoded))
+	if assert.Len(t, decoded.Summary.CategoryStatistics, 1) {
+		assert.Equal(t, category, decoded.Summary.CategoryStatistics[0].Name)
+		assert.Equal(t, 1, decoded.Summary.CategoryStatistics[0].Count)
+	}
+}
@@ -3,6 +3,7 @@ package sensitive
 import (
 	"context"
 	"fmt"
+	"sync"
 	"time"
 
 	"github.com/StellarServer/internal/models"
@@ -285,17 +286,38 @@ type ActivityPoint struct {
 	Findings int64     `json:"findings"`
 }
 
+// batchScanConcurrency 批量扫描URL时的最大并发数
+const batchScanConcurrency = 5
+
 // 批量操作方法
 func (s *Service) BatchScanURLs(urls []string) ([]*DetectionResult, error) {
-	var results []*DetectionResult
+	// URL扫描主要耗时在网络等待，使用有限并发扫描，并按输入顺序收集结果
+	scanned := make([]*DetectionResult, len(urls))
+	semaphore := make(chan struct{}, batchScanConcurrency)
+	var wg sync.WaitGroup
+
+	for i, url := range urls {
+		wg.Add(1)
+		semaphore <- struct{}{}
+		go func(i int, url string) {
+			defer wg.Done()
+			defer func() { <-semaphore }()
+
+			result, err := s.engine.ScanURL(url)
+			if err != nil {
+				// 记录错误但继续处理其他URL
+				return
+			}
+			scanned[i] = result
+		}(i, url)
+	}
+	wg.Wait()
 
-	for _, url := range urls {
-		result, err := s.engine.ScanURL(url)
-		if err != nil {
-			// 记录错误但继续处理其他URL
-			continue
+	var results []*DetectionResult
+	for _, result := range scanned {
+		if result != nil {
+			results = append(results, result)
 		}
-		results = append(results, result)
 	}
 
 	return results, nil